@@ -13,6 +13,9 @@ Usage:
     You can use the following functions:
         - set_cube(self, cubes: np.array(Cube)): 
           Sets the positions, sizes, rotations, and colors of cubes to be rendered.
+
+        - set_cube_arrays(self, positions, sizes, rotations, colors):
+          Same as set_cube, taking one (n, 3) array per attribute.
         
         - set_points(self, points: np.array(GroupPoints)):
           Sets the positions and colors of points to be rendered.
@@ -22,7 +25,8 @@ Usage:
 
 Dependencies:
     - PySide6 for Qt Widgets and OpenGL support
-    - OpenGL.GL and OpenGL.GLU for rendering
+    - OpenGL.GL for rendering (requires an OpenGL 3.3 core profile context)
+    - numba (optional) to build the cube model matrices in parallel
 
 Classes:
     - Cube: Represents a cube with a position, size, rotation, and color.
@@ -32,37 +36,141 @@ QOpenGL3DViewer:
     A Qt widget for 3D rendering using OpenGL. This viewer supports rendering 
     simple 3D objects such as cubes and points. The camera can be controlled 
     interactively using the mouse (rotation, translation, zoom).
+    Geometry lives in GPU buffers (VBOs) and is drawn with GLSL shaders; the
+    camera and model matrices are composed with numpy.
 """
 
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
-from PySide6.QtGui import QVector2D
-from OpenGL.GL import (glClearColor, glShadeModel, glMatrixMode,
-                       glLoadIdentity, glPushMatrix, glPopMatrix,
-                       glEnable, glViewport, glTranslatef, glRotatef,
-                       glClear, glBegin, glEnd, glColor3f, glVertexPointer,
-                       glVertex3f, glPointSize, glDrawArrays,glEnableClientState, 
-                       glDisableClientState, )
-from OpenGL.GL import (GL_DEPTH_TEST, GL_SMOOTH, GL_PROJECTION, GL_MODELVIEW,
-                       GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_LINES, GL_FLOAT,
-                       GL_POINTS, GL_VERTEX_ARRAY)
-from OpenGL.GLU import gluPerspective
+from PySide6.QtGui import QVector2D, QSurfaceFormat
+from OpenGL.GL import (glClearColor, glEnable, glViewport, glClear,
+                       glPointSize, glDrawArrays, glGenVertexArrays,
+                       glBindVertexArray, glGenBuffers, glBindBuffer,
+                       glBufferData, glBufferSubData, glEnableVertexAttribArray,
+                       glVertexAttribPointer, glUseProgram, glGetUniformLocation,
+                       glUniformMatrix4fv, glUniform3f, glVertexAttribDivisor,
+                       glDrawElementsInstanced, glDeleteBuffers, glBufferStorage,
+                       glMapBufferRange, glUnmapBuffer, glFenceSync,
+                       glClientWaitSync, glDeleteSync, )
+from OpenGL.GL import (GL_DEPTH_TEST, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT,
+                       GL_LINES, GL_FLOAT, GL_POINTS, GL_ARRAY_BUFFER,
+                       GL_STATIC_DRAW, GL_DYNAMIC_DRAW, GL_FALSE, GL_TRUE,
+                       GL_VERTEX_SHADER, GL_FRAGMENT_SHADER,
+                       GL_ELEMENT_ARRAY_BUFFER, GL_UNSIGNED_INT, GL_STREAM_DRAW,
+                       GL_MAP_WRITE_BIT, GL_MAP_PERSISTENT_BIT, GL_MAP_COHERENT_BIT,
+                       GL_SYNC_GPU_COMMANDS_COMPLETE, GL_SYNC_FLUSH_COMMANDS_BIT)
+from OpenGL.GL.shaders import compileProgram, compileShader
 
 from time import time
+import ctypes
+import math
 import numpy as np
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, model matrices are then built with numpy
+    njit = None
 
-@dataclass
+
+_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec3 pos;
+
+uniform mat4 uMVP;
+
+void main()
+{
+    gl_Position = uMVP * vec4(pos, 1.0);
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330 core
+uniform vec3 uColor;
+
+out vec4 fragColor;
+
+void main()
+{
+    fragColor = vec4(uColor, 1.0);
+}
+"""
+
+# Instanced cubes: attribute 0 is a unit cube corner, attributes 1-4 are
+# the columns of the per-cube model matrix and attribute 5 its color.
+_CUBE_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec3 pos;
+layout(location = 1) in mat4 in_model;
+layout(location = 5) in vec3 in_color;
+
+uniform mat4 uMVP;
+
+out vec3 color;
+
+void main()
+{
+    gl_Position = uMVP * in_model * vec4(pos, 1.0);
+    color = in_color;
+}
+"""
+
+_CUBE_FRAGMENT_SHADER = """
+#version 330 core
+in vec3 color;
+
+out vec4 fragColor;
+
+void main()
+{
+    fragColor = vec4(color, 1.0);
+}
+"""
+
+# Number of floats per cube in the instance buffer (model matrix, color)
+_CUBE_INSTANCE_FLOATS = 16 + 3
+
+# Points are streamed through a persistently mapped buffer split in this many
+# regions, written round-robin so the CPU never overwrites data the GPU may
+# still be reading. Each region starts sized for 1024 points and grows as needed.
+_POINTS_REGIONS = 3
+_POINTS_MIN_CAPACITY = 1024 * 3 * 4
+_FENCE_TIMEOUT_NS = 1000000000
+
+# Sign of each coordinate of the 8 cube corners
+_CUBE_CORNER_SIGNS = np.array([
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]
+], dtype=np.float32)
+
+# Pairs of cube vertex indices joined by an edge, used as the cube index buffer
+_CUBE_EDGES = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],
+    [4, 5], [5, 6], [6, 7], [7, 4],
+    [0, 4], [1, 5], [2, 6], [3, 7]
+], dtype=np.uint32)
+
+# Coordinate axes (X, Y, Z) as three line segments starting at the origin.
+_AXES_VERTICES = np.array([
+    [0, 0, 0], [10, 0, 0],
+    [0, 0, 0], [0, 10, 0],
+    [0, 0, 0], [0, 0, 10]
+], dtype=np.float32)
+_AXES_COLORS = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+
+@dataclass(slots=True, frozen=True)
 class Cube:
     """
-    Represents a 3D cube object.
+    Represents a 3D cube object. For large scenes prefer
+    QOpenGL3DViewer.set_cube_arrays, which needs no Cube objects at all.
 
     Attributes:
         position (np.array): The (x, y, z) coordinates of the cube's center.
-        size (np.array): The dimensions (width, height) of the cube. 
-                         Defaults to (1.0, 1.0).
+        size (np.array): The dimensions (width, height, depth) of the cube. 
+                         Defaults to (1.0, 1.0, 1.0).
         rotation (np.array): The rotation angles (in degrees) around the 
                              (x, y, z) axes. Defaults to (0.0, 0.0, 0.0).
         color (np.array): The RGB color of the cube, represented as a 
@@ -70,9 +178,9 @@ class Cube:
     """
 
     position: np.array  # The position of the cube's center in 3D space.
-    size: np.array = np.array((1.0, 1.0))  # The size of the cube (width, height).
-    rotation: np.array = np.array((0.0, 0.0, 0.0))  # Rotation angles (x, y, z).
-    color: np.array = np.array((1.0, 1.0, 0.0))  # Cube color (R, G, B).
+    size: np.array = field(default_factory=lambda: np.array((1.0, 1.0, 1.0), dtype=np.float32))  # The size of the cube (width, height, depth).
+    rotation: np.array = field(default_factory=lambda: np.array((0.0, 0.0, 0.0), dtype=np.float32))  # Rotation angles (x, y, z).
+    color: np.array = field(default_factory=lambda: np.array((1.0, 1.0, 0.0), dtype=np.float32))  # Cube color (R, G, B).
 
 @dataclass
 class GroupPoints:
@@ -87,7 +195,138 @@ class GroupPoints:
     """
 
     points: np.array  # Array of points in 3D space.
-    color: np.array = np.array((0.0, 1.0, 1.0))  # Color of the points (R, G, B).
+    color: np.array = field(default_factory=lambda: np.array((0.0, 1.0, 1.0), dtype=np.float32))  # Color of the points (R, G, B).
+
+
+def _perspective(fovy, aspect, near, far):
+    """Builds a perspective projection matrix (same as gluPerspective)."""
+    f = 1.0 / np.tan(np.radians(fovy) / 2.0)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0]
+    ], dtype=np.float32)
+
+
+def _translation(x, y, z):
+    """Builds a translation matrix (same as glTranslatef)."""
+    matrix = np.identity(4, dtype=np.float32)
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+
+def _rotation(angle, axis):
+    """Builds a rotation matrix around the X (0), Y (1) or Z (2) axis.
+
+    Args:
+        angle (float): The rotation angle in degrees, as in glRotatef.
+        axis (int): Index of the rotation axis.
+    """
+    c, s = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+    i, j = (axis + 1) % 3, (axis + 2) % 3
+    matrix = np.identity(4, dtype=np.float32)
+    matrix[i, i], matrix[i, j] = c, -s
+    matrix[j, i], matrix[j, j] = s, c
+    return matrix
+
+
+def _frustum_planes(mvp):
+    """Extracts the 6 clipping planes of a view frustum (Gribb-Hartmann).
+
+    Args:
+        mvp (np.array): 4x4 model-view-projection matrix.
+
+    Returns:
+        np.array: A (6, 4) float32 array of normalized (a, b, c, d) planes,
+                  with normals pointing into the frustum.
+    """
+    planes = np.array([
+        mvp[3] + mvp[0], mvp[3] - mvp[0],  # left, right
+        mvp[3] + mvp[1], mvp[3] - mvp[1],  # bottom, top
+        mvp[3] + mvp[2], mvp[3] - mvp[2]   # near, far
+    ], dtype=np.float32)
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+
+def _spheres_in_frustum(planes, centers, radii):
+    """Tests bounding spheres against the frustum planes.
+
+    Args:
+        planes (np.array): (6, 4) frustum planes from _frustum_planes.
+        centers (np.array): (n, 3) sphere centers.
+        radii (np.array): (n,) sphere radii.
+
+    Returns:
+        np.array: (n,) boolean mask, True for spheres at least partially inside.
+    """
+    distances = planes[:, :3] @ centers.T + planes[:, 3:]
+    return (distances >= -radii).all(axis=0)
+
+
+def _build_model_mats_numpy(pos, rot, size, out):
+    """Composes the model matrix T * Rx * Ry * Rz * S of every cube.
+
+    Args:
+        pos (np.array): (n, 3) float32 cube centers.
+        rot (np.array): (n, 3) float32 rotation angles in degrees.
+        size (np.array): (n, 3) float32 cube dimensions.
+        out (np.array): (n, 16) float32 output, one column-major 4x4 matrix per row.
+    """
+    c, s = np.cos(np.radians(rot)), np.sin(np.radians(rot))
+    cx, cy, cz = c.T
+    sx, sy, sz = s.T
+    m = out.reshape(-1, 4, 4)  # m[i, column, row]
+    m[:, 0, 0] = cy * cz * size[:, 0]
+    m[:, 0, 1] = (sx * sy * cz + cx * sz) * size[:, 0]
+    m[:, 0, 2] = (sx * sz - cx * sy * cz) * size[:, 0]
+    m[:, 1, 0] = -cy * sz * size[:, 1]
+    m[:, 1, 1] = (cx * cz - sx * sy * sz) * size[:, 1]
+    m[:, 1, 2] = (cx * sy * sz + sx * cz) * size[:, 1]
+    m[:, 2, 0] = sy * size[:, 2]
+    m[:, 2, 1] = -sx * cy * size[:, 2]
+    m[:, 2, 2] = cx * cy * size[:, 2]
+    m[:, :3, 3] = 0.0
+    m[:, 3, :3] = pos
+    m[:, 3, 3] = 1.0
+
+
+if njit is not None:
+    # Explicit signature: compiled (or loaded from the cache) at import time
+    # instead of stalling the first frame that sets cubes.
+    @njit("void(float32[:, ::1], float32[:, ::1], float32[:, ::1], float32[:, ::1])",
+          parallel=True, fastmath=True, cache=True)
+    def _build_model_mats(pos, rot, size, out):
+        """Same as _build_model_mats_numpy, compiled and split across cores."""
+        for i in prange(pos.shape[0]):
+            cx, sx = math.cos(math.radians(rot[i, 0])), math.sin(math.radians(rot[i, 0]))
+            cy, sy = math.cos(math.radians(rot[i, 1])), math.sin(math.radians(rot[i, 1]))
+            cz, sz = math.cos(math.radians(rot[i, 2])), math.sin(math.radians(rot[i, 2]))
+            out[i, 0] = cy * cz * size[i, 0]
+            out[i, 1] = (sx * sy * cz + cx * sz) * size[i, 0]
+            out[i, 2] = (sx * sz - cx * sy * cz) * size[i, 0]
+            out[i, 3] = 0.0
+            out[i, 4] = -cy * sz * size[i, 1]
+            out[i, 5] = (cx * cz - sx * sy * sz) * size[i, 1]
+            out[i, 6] = (cx * sy * sz + sx * cz) * size[i, 1]
+            out[i, 7] = 0.0
+            out[i, 8] = sy * size[i, 2]
+            out[i, 9] = -sx * cy * size[i, 2]
+            out[i, 10] = cx * cy * size[i, 2]
+            out[i, 11] = 0.0
+            out[i, 12] = pos[i, 0]
+            out[i, 13] = pos[i, 1]
+            out[i, 14] = pos[i, 2]
+            out[i, 15] = 1.0
+else:
+    _build_model_mats = _build_model_mats_numpy
+
+
+# Corners of the unit cube, indexed by _CUBE_EDGES and shared by every viewer and
+# GL context; the per-cube size is applied by the model matrix.
+_UNIT_CUBE_VERTICES = _CUBE_CORNER_SIGNS * 0.5
+
+
 class QOpenGL3DViewer(QOpenGLWidget):
     """
     A Qt widget for 3D rendering using OpenGL. This viewer supports rendering 
@@ -103,8 +342,12 @@ class QOpenGL3DViewer(QOpenGLWidget):
         last_mouse_position (QVector2D): Last recorded mouse position.
         mouse_pressed (bool): Indicates if the left mouse button is pressed.
         right_mouse_pressed (bool): Indicates if the right mouse button is pressed.
-        cubes (np.array): Array of Cube objects to be rendered.
+        cube_positions (np.array): (n, 3) float32 centers of the cubes to be rendered.
+        cube_sizes (np.array): (n, 3) float32 dimensions of the cubes.
+        cube_rotations (np.array): (n, 3) float32 rotation angles of the cubes (degrees).
+        cube_colors (np.array): (n, 3) float32 RGB colors of the cubes.
         points (np.array): Array of GroupPoints objects to be rendered.
+        point_size (float): Size in pixels of the rendered points. Defaults to 2.0.
         render_timer (QTimer): Timer for controlling the rendering frame rate.
     """
 
@@ -118,6 +361,12 @@ class QOpenGL3DViewer(QOpenGLWidget):
         """
         super(QOpenGL3DViewer, self).__init__(parent)
 
+        # Request a core profile context, needed for VAOs and GLSL 3.30
+        surface_format = QSurfaceFormat.defaultFormat()
+        surface_format.setVersion(3, 3)
+        surface_format.setProfile(QSurfaceFormat.OpenGLContextProfile.CoreProfile)
+        self.setFormat(surface_format)
+
         # Initialize camera and interaction parameters
         self.angle_x = 0  
         self.angle_y = 0  
@@ -129,19 +378,114 @@ class QOpenGL3DViewer(QOpenGLWidget):
         self.right_mouse_pressed = False  
 
         # Object positions
-        self.cubes = np.zeros((0), dtype=Cube) 
+        self.cube_positions = np.zeros((0, 3), dtype=np.float32)
+        self.cube_sizes = np.zeros((0, 3), dtype=np.float32)
+        self.cube_rotations = np.zeros((0, 3), dtype=np.float32)
+        self.cube_colors = np.zeros((0, 3), dtype=np.float32)
         self.points = np.zeros((0), dtype=GroupPoints)  
+        self.point_size = 2.0
+
+        # GPU resources, created in initializeGL
+        self._proj = np.identity(4, dtype=np.float32)
+        self._mvp = None
+        self._camera = None
+        self._program = self._cube_program = None
+        self._axes_vao = self._cube_vao = self._points_vao = None
+        self._cube_instance_vbo = self._points_vbo = None
+        self._points_vertices = np.zeros((0, 3), dtype=np.float32)
+        self._point_ranges = []
+        self._points_capacity = 0
+        self._points_mapped = None
+        self._points_fences = []
+        self._points_region = 0
+        self._points_first = 0
+        self._cube_models = np.zeros((0, 16), dtype=np.float32)
+        self._cube_radii = np.zeros(0, dtype=np.float32)
+        self._culled_mvp = None
+        self._visible_cubes = 0
+        self._cubes_dirty = self._points_dirty = True
+
+        # Frame counter for the FPS report
+        self._frames = 0
+        self._last_print = time()
 
         # Render timer for continuous updating
         self.render_timer = QTimer(self)
+        self.render_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.render_timer.timeout.connect(self.update)
         self.change_FPS(FPS)
 
     def initializeGL(self):
-        """Initializes the OpenGL context and sets background color and depth test."""
+        """Initializes the OpenGL context: shaders, buffers and depth test."""
         glClearColor(0.1, 0.1, 0.1, 1.0)  # Background color
         glEnable(GL_DEPTH_TEST)  # Enable depth testing
-        glShadeModel(GL_SMOOTH)  # Set the shading model to smooth
+
+        # Shader programs: plain color (axes and points) and instanced cubes
+        self._program = compileProgram(
+            compileShader(_VERTEX_SHADER, GL_VERTEX_SHADER),
+            compileShader(_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False)
+        self._u_mvp = glGetUniformLocation(self._program, "uMVP")
+        self._u_color = glGetUniformLocation(self._program, "uColor")
+        self._cube_program = compileProgram(
+            compileShader(_CUBE_VERTEX_SHADER, GL_VERTEX_SHADER),
+            compileShader(_CUBE_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+            validate=False)
+        self._u_cube_mvp = glGetUniformLocation(self._cube_program, "uMVP")
+
+        # Static buffers: coordinate axes and a unit cube scaled per instance,
+        # its 8 corners shared by the 12 edges through an index buffer
+        self._axes_vao, _ = self._create_vao(_AXES_VERTICES, GL_STATIC_DRAW)
+        self._cube_vao, _ = self._create_vao(_UNIT_CUBE_VERTICES, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, glGenBuffers(1))
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, _CUBE_EDGES.nbytes, _CUBE_EDGES, GL_STATIC_DRAW)
+
+        # Per-instance cube attributes, advanced once per cube instead of per vertex
+        self._cube_instance_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._cube_instance_vbo)
+        stride = _CUBE_INSTANCE_FLOATS * 4
+        for i in range(5):
+            glEnableVertexAttribArray(1 + i)
+            glVertexAttribPointer(1 + i, 4 if i < 4 else 3, GL_FLOAT, GL_FALSE, stride,
+                                  ctypes.c_void_p(i * 4 * 4))
+            glVertexAttribDivisor(1 + i, 1)
+        self._cubes_dirty = True
+
+        # Streaming buffer for the points, filled when they change. Persistent
+        # mapping needs GL 4.4 / ARB_buffer_storage; otherwise orphan on write.
+        self._points_vao = glGenVertexArrays(1)
+        glBindVertexArray(self._points_vao)
+        glEnableVertexAttribArray(0)
+        self._points_vbo = None
+        self._points_mapped = None
+        self._points_fences = []
+        context = self.context()
+        self._persistent_points = (context.format().version() >= (4, 4)
+                                   or context.hasExtension(b"GL_ARB_buffer_storage"))
+        self._create_points_buffer(_POINTS_MIN_CAPACITY)
+        self._points_dirty = True
+
+        glBindVertexArray(0)
+
+    def _create_vao(self, vertices, usage):
+        """Creates a VAO with a single vec3 attribute backed by a new VBO.
+
+        Args:
+            vertices (np.array): Initial (n, 3) float32 vertex data.
+            usage (GLenum): Buffer usage hint (GL_STATIC_DRAW, GL_DYNAMIC_DRAW...).
+
+        Returns:
+            tuple: The (vao, vbo) handles. The VAO is left bound.
+        """
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes,
+                     vertices if vertices.size else None, usage)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
+        return vao, vbo
 
     def resizeGL(self, w, h):
         """
@@ -154,129 +498,183 @@ class QOpenGL3DViewer(QOpenGLWidget):
         if h == 0:
             h = 1
         glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, w / h, 0.1, 100.0)
-        glMatrixMode(GL_MODELVIEW)
+        self._proj = _perspective(45, w / h, 0.1, 100.0)
+        self._mvp = None
 
     def paintGL(self):
         """Renders the scene in the OpenGL context."""
-        t = time()
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
 
-        # Apply camera transformations
-        glTranslatef(self.translate_x, self.translate_y, self.zoom)
-        glRotatef(self.angle_x, 1.0, 0.0, 0.0)  
-        glRotatef(self.angle_y, 0.0, 1.0, 0.0)  
+        # Camera view-projection matrix, rebuilt only when the camera changes
+        mvp = self._view_projection()
+
+        # Render cubes, all of them in a single instanced draw call
+        glUseProgram(self._cube_program)
+        glUniformMatrix4fv(self._u_cube_mvp, 1, GL_TRUE, mvp)
+        glBindVertexArray(self._cube_vao)
+        if self._cubes_dirty or mvp is not self._culled_mvp:
+            self._upload_cubes(mvp)
+        self.draw_cubes(self._visible_cubes)
+
+        glUseProgram(self._program)
+        glUniformMatrix4fv(self._u_mvp, 1, GL_TRUE, mvp)
 
         # Draw the coordinate axes
         self.draw_axes()
 
-        # Render cubes
-        for cube in self.cubes:
-            glPushMatrix()
-            glTranslatef(*cube.position)
-            glColor3f(*cube.color)
-            glRotatef(cube.rotation[0], 1, 0, 0)  
-            glRotatef(cube.rotation[1], 0, 1, 0)  
-            glRotatef(cube.rotation[2], 0, 0, 1)  
-            self.draw_cube(cube.size)  
-            glPopMatrix()
-
         # Render points
-        for groupPoint in self.points:
-            glColor3f(*groupPoint.color)
-            self.draw_points(points=groupPoint.points)
-
-        print(f"\rDraw time: {1/(time()-t):.4f} FPS", end="")
+        glBindVertexArray(self._points_vao)
+        if self._points_dirty:
+            self._upload_points()
+        glPointSize(self.point_size)
+        first = self._points_first
+        for offset, count, color in self._point_ranges:
+            glUniform3f(self._u_color, *color)
+            self.draw_points(first + offset, count)
+        if self._points_mapped is not None:
+            # Mark when the GPU is done reading the current region
+            if self._points_fences[self._points_region] is not None:
+                glDeleteSync(self._points_fences[self._points_region])
+            self._points_fences[self._points_region] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+        glBindVertexArray(0)
+        glUseProgram(0)
+
+        # Report the frame rate at most once per second
+        self._frames += 1
+        now = time()
+        if now - self._last_print >= 1.0:
+            print(f"\rDraw rate: {self._frames / (now - self._last_print):.4f} FPS", end="")
+            self._frames = 0
+            self._last_print = now
+
+    def _view_projection(self):
+        """Returns the camera MVP matrix, rebuilt only when the camera or projection change.
+
+        Returns:
+            np.array: 4x4 float32 model-view-projection matrix (row-major).
+        """
+        camera = (self.angle_x, self.angle_y, self.translate_x, self.translate_y, self.zoom)
+        if self._mvp is None or camera != self._camera:
+            view = (_translation(self.translate_x, self.translate_y, self.zoom)
+                    @ _rotation(self.angle_x, 0)
+                    @ _rotation(self.angle_y, 1))
+            self._mvp = self._proj @ view
+            self._camera = camera
+        return self._mvp
 
     def draw_axes(self):
         """Draws the coordinate axes (X, Y, Z) in different colors."""
-        glBegin(GL_LINES)
-
-        # X axis (red)
-        glColor3f(1.0, 0.0, 0.0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(10, 0, 0)
-
-        # Y axis (green)
-        glColor3f(0.0, 1.0, 0.0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 10, 0)
+        glBindVertexArray(self._axes_vao)
+        for i, color in enumerate(_AXES_COLORS):
+            glUniform3f(self._u_color, *color)
+            glDrawArrays(GL_LINES, 2 * i, 2)
 
-        # Z axis (blue)
-        glColor3f(0.0, 0.0, 1.0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 0, 10)
-
-        glEnd()
-
-    def draw_cube(self, size=np.array((1, 1))):
-        """Draws a cube with colored edges.
+    def draw_cubes(self, count):
+        """Draws the edges of every cube instance. The cube VAO must be bound.
 
         Args:
-            size (np.array): The dimensions of the cube.
+            count (int): Number of cube instances in the instance buffer.
         """
-        # Create cube vertices based on size
-        half_size = size / 2.0
-        vertices = np.array([
-            [-half_size[0], -half_size[1], -half_size[2]], 
-            [half_size[0], -half_size[1], -half_size[2]],
-            [half_size[0],  half_size[1], -half_size[2]], 
-            [-half_size[0],  half_size[1], -half_size[2]],
-            [-half_size[0], -half_size[1],  half_size[2]], 
-            [half_size[0], -half_size[1],  half_size[2]],
-            [half_size[0],  half_size[1],  half_size[2]], 
-            [-half_size[0],  half_size[1],  half_size[2]]
-        ], dtype=np.float32)
-
-        edges = [
-            [0, 1], [1, 2], [2, 3], [3, 0],
-            [4, 5], [5, 6], [6, 7], [7, 4],
-            [0, 4], [1, 5], [2, 6], [3, 7]
-        ]
-
-        # Enable vertex array mode
-        glEnableClientState(GL_VERTEX_ARRAY)
-
-        # Define vertices for lines
-        line_vertices = vertices[edges].reshape(-1, 3)
-
-        # Set vertex pointer to the line vertices
-        glVertexPointer(3, GL_FLOAT, 0, line_vertices)
-
-        # Draw the edges in one call
-        glDrawArrays(GL_LINES, 0, line_vertices.shape[0])
-
-        # Disable vertex array mode
-        glDisableClientState(GL_VERTEX_ARRAY)
-
-    def draw_points(self, points, size=2.0):
+        if count == 0:
+            return
+
+        glDrawElementsInstanced(GL_LINES, _CUBE_EDGES.size, GL_UNSIGNED_INT, None, count)
+
+    def draw_points(self, offset, count):
         """
-        Draws points in 3D space.
+        Draws a range of the points buffer. The points VAO must be bound
+        and the point size already set.
 
         Args:
-            points (np.array): The 3D coordinates of points to render.
-            size (float): The size of the points to render. Defaults to 2.0.
+            offset (int): Index of the first point in the points buffer.
+            count (int): Number of points to render.
         """
-        if points.size == 0:
-            return
+        # Draw this group's range of the shared points buffer
+        glDrawArrays(GL_POINTS, offset, count)
+
+    def _upload_cubes(self, mvp):
+        """Packs the attributes of the visible cubes and uploads them to the instance VBO.
 
-        # Set point size
-        glPointSize(size)
+        Cubes whose bounding sphere lies outside the view frustum are left out.
 
-        # Enable vertex array mode
-        glEnableClientState(GL_VERTEX_ARRAY)
+        Args:
+            mvp (np.array): 4x4 model-view-projection matrix used for culling.
+        """
+        visible = _spheres_in_frustum(_frustum_planes(mvp), self.cube_positions, self._cube_radii)
+        instances = np.hstack((self._cube_models[visible], self.cube_colors[visible]))
+        self._visible_cubes = len(instances)
+        self._culled_mvp = mvp
+        glBindBuffer(GL_ARRAY_BUFFER, self._cube_instance_vbo)
+        glBufferData(GL_ARRAY_BUFFER, instances.nbytes,
+                     instances.tobytes() if instances.size else None, GL_DYNAMIC_DRAW)
+        self._cubes_dirty = False
 
-        # Define the vertex array (3 coordinates per point)
-        glVertexPointer(3, GL_FLOAT, 0, points)
+    def _create_points_buffer(self, capacity):
+        """(Re)creates the points VBO and attaches it to the points VAO.
 
-        # Draw all points in one call
-        glDrawArrays(GL_POINTS, 0, len(points))
+        With persistent mapping the buffer holds _POINTS_REGIONS regions and
+        stays mapped as a numpy view for its whole life. The points VAO must be bound.
 
-        # Disable vertex array mode
-        glDisableClientState(GL_VERTEX_ARRAY)
+        Args:
+            capacity (int): Size in bytes of each region.
+        """
+        if self._points_vbo is not None:
+            glBindBuffer(GL_ARRAY_BUFFER, self._points_vbo)
+            if self._points_mapped is not None:
+                glUnmapBuffer(GL_ARRAY_BUFFER)
+            glDeleteBuffers(1, [self._points_vbo])
+        for fence in self._points_fences:
+            if fence is not None:
+                glDeleteSync(fence)
+
+        self._points_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._points_vbo)
+        if self._persistent_points:
+            flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+            glBufferStorage(GL_ARRAY_BUFFER, _POINTS_REGIONS * capacity, None, flags)
+            address = glMapBufferRange(GL_ARRAY_BUFFER, 0, _POINTS_REGIONS * capacity, flags)
+            floats = ctypes.cast(address, ctypes.POINTER(ctypes.c_float))
+            self._points_mapped = np.ctypeslib.as_array(floats, shape=(_POINTS_REGIONS, capacity // 4))
+            self._points_fences = [None] * _POINTS_REGIONS
+        else:
+            glBufferData(GL_ARRAY_BUFFER, capacity, None, GL_STREAM_DRAW)
+            self._points_mapped = None
+            self._points_fences = []
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
+        self._points_capacity = capacity
+        self._points_region = 0
+        self._points_first = 0
+
+    def _upload_points(self):
+        """Copies the concatenated points into the points VBO. The points VAO must be bound.
+
+        With a persistently mapped buffer the points are copied into the next
+        region once the GPU has finished reading it, without any upload call.
+        Otherwise the buffer is orphaned and refilled with glBufferSubData, so
+        the driver does not have to wait for the previous contents either.
+        """
+        vertices = self._points_vertices
+        if vertices.nbytes > self._points_capacity:
+            self._create_points_buffer(max(vertices.nbytes, 2 * self._points_capacity))
+
+        if self._points_mapped is not None:
+            region = (self._points_region + 1) % _POINTS_REGIONS
+            fence = self._points_fences[region]
+            if fence is not None:
+                glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, _FENCE_TIMEOUT_NS)
+                glDeleteSync(fence)
+                self._points_fences[region] = None
+            np.copyto(self._points_mapped[region, :vertices.size], vertices.reshape(-1))
+            self._points_region = region
+            self._points_first = region * (self._points_capacity // (3 * 4))
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self._points_vbo)
+            glBufferData(GL_ARRAY_BUFFER, self._points_capacity, None, GL_STREAM_DRAW)
+            if vertices.size:
+                glBufferSubData(GL_ARRAY_BUFFER, 0, vertices.nbytes, vertices)
+            self._points_first = 0
+        self._points_dirty = False
 
     def set_cube(self, cubes: np.array(Cube)):
         """Updates the positions, sizes, rotations, and colors of the cubes.
@@ -284,15 +682,65 @@ class QOpenGL3DViewer(QOpenGLWidget):
         Args:
             cubes (np.array): An array of Cube objects to be rendered.
         """
-        self.cubes = cubes
+        self.set_cube_arrays(
+            positions=[cube.position for cube in cubes],
+            sizes=[cube.size for cube in cubes],
+            rotations=[cube.rotation for cube in cubes],
+            colors=[cube.color for cube in cubes])
+
+    def set_cube_arrays(self, positions, sizes, rotations, colors):
+        """Updates the cubes from one array per attribute (structure of arrays).
+
+        The arrays are uploaded to the GPU once, on the next repaint.
+
+        Args:
+            positions (np.array): (n, 3) centers of the cubes.
+            sizes (np.array): (n, 3) dimensions of the cubes.
+            rotations (np.array): (n, 3) rotation angles (in degrees) around the (x, y, z) axes.
+            colors (np.array): (n, 3) normalized RGB colors of the cubes.
+        """
+        # The model-matrix kernel only accepts writable C-contiguous float32
+        # arrays; copy only when the input is not one already (e.g. np.frombuffer)
+        self.cube_positions = np.require(np.reshape(positions, (-1, 3)), np.float32, ['C', 'W'])
+        self.cube_sizes = np.require(np.reshape(sizes, (-1, 3)), np.float32, ['C', 'W'])
+        self.cube_rotations = np.require(np.reshape(rotations, (-1, 3)), np.float32, ['C', 'W'])
+        self.cube_colors = np.ascontiguousarray(colors, dtype=np.float32).reshape(-1, 3)
+        # Model matrix of each cube, rebuilt only here and not on every frame
+        if len(self._cube_models) != len(self.cube_positions):
+            self._cube_models = np.empty((len(self.cube_positions), 16), dtype=np.float32)
+        _build_model_mats(self.cube_positions, self.cube_rotations, self.cube_sizes,
+                          self._cube_models)
+        # Radius of the sphere enclosing each cube, whatever its rotation
+        self._cube_radii = 0.5 * np.linalg.norm(self.cube_sizes, axis=1)
+        self._cubes_dirty = True
 
     def set_points(self, points: np.array(GroupPoints)):
         """Sets the positions and colors of points to be rendered.
 
+        The points of each group are converted in place to contiguous float32
+        arrays, then all groups are concatenated into a single buffer here and
+        uploaded to the GPU once, on the next repaint.
+
         Args:
             points (np.array): An array of GroupPoints objects.
         """
+        for group in points:
+            group.points = np.ascontiguousarray(group.points, dtype=np.float32).reshape(-1, 3)
         self.points = points
+        if len(points):
+            self._points_vertices = np.vstack([group.points for group in points])
+        else:
+            self._points_vertices = np.zeros((0, 3), dtype=np.float32)
+
+        # (offset, count, color) of each non-empty group inside the buffer
+        self._point_ranges = []
+        offset = 0
+        for group in points:
+            count = len(group.points)
+            if count:
+                self._point_ranges.append((offset, count, tuple(float(c) for c in group.color)))
+            offset += count
+        self._points_dirty = True
 
     def change_FPS(self, FPS: float):
         """Adjusts the rendering frame rate.
@@ -302,7 +750,7 @@ class QOpenGL3DViewer(QOpenGLWidget):
         """
         if self.render_timer.isActive():
             self.render_timer.stop()
-        self.render_timer.start(1000 / FPS)
+        self.render_timer.start(max(1, int(round(1000.0 / FPS))))
 
     ################### MOUSE EVENTS ###################
 
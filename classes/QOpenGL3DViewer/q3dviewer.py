@@ -12,7 +12,7 @@ from ui_form import Ui_Q3DViewer
 from PySide6.QtCore import QTimer
 
 import random
-from QOpenGL3DViewer import QOpenGL3DViewer, Cube, GroupPoints
+from QOpenGL3DViewer import QOpenGL3DViewer, GroupPoints
 import numpy as np
 
 
@@ -27,6 +27,8 @@ class Q3DViewer(QWidget):
         self.ui.viewer.addWidget(self.opengl_widget)
         ###
 
+        self._rng = np.random.default_rng()
+
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.generate_things)
         self.timer.start(100)
@@ -40,28 +42,17 @@ class Q3DViewer(QWidget):
         num_points = self.ui.slider_points.value()//3
         num_cubes = self.ui.slider_cube.value()
 
-        positions = np.random.uniform(-0, 10, 3*num_cubes).reshape((num_cubes,3))
-        rotations = np.random.uniform(0, 360, 3*num_cubes).reshape((num_cubes,3))
-        sizes = np.random.uniform(-0, 3, 3*num_cubes).reshape((num_cubes,3))
-        colors = np.random.uniform(0, 1, 3*num_cubes).reshape((num_cubes,3))
-        cubes = np.array(())
-        for i in range(num_cubes):
-            cube = Cube(
-                position=positions[i],
-                size=sizes[i],
-                rotation=rotations[i],
-                color=colors[i]
-            )
-            cubes = np.append(cubes, cube)
-
-        points_red = GroupPoints(points=np.random.uniform(-distance, distance, num_points*3).reshape((num_points,3)),
-                                 color=np.array((1,0,0)))
-        points_green = GroupPoints(points=np.random.uniform(-distance, distance, num_points*3).reshape((num_points,3)),
-                                 color=np.array((0,1,0)))
-        points_blue = GroupPoints(points=np.random.uniform(-distance, distance, num_points*3).reshape((num_points,3)),
-                                 color=np.array((0,0,1)))
-
-        self.opengl_widget.set_cube(cubes)
+        # Upper bounds of positions, rotations, sizes and colors, one row each
+        cube_high = np.array((10, 360, 3, 1)).reshape((4, 1, 1))
+        positions, rotations, sizes, colors = self._rng.uniform(
+            0, cube_high, (4, num_cubes, 3)).astype(np.float32, copy=False)
+
+        pts = self._rng.uniform(-distance, distance, (3, num_points, 3)).astype(np.float32, copy=False)
+        points_red = GroupPoints(points=pts[0], color=np.array((1,0,0), np.float32))
+        points_green = GroupPoints(points=pts[1], color=np.array((0,1,0), np.float32))
+        points_blue = GroupPoints(points=pts[2], color=np.array((0,0,1), np.float32))
+
+        self.opengl_widget.set_cube_arrays(positions, sizes, rotations, colors)
         self.opengl_widget.set_points(np.array((points_red, points_green, points_blue)))
 
         self.ui.label_cube.setText(f"{num_cubes} CUBES")